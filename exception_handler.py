@@ -9,6 +9,7 @@ from exceptions import (
     InvalidPipelineParam,
     UnknownTransformer,
     EmptyPipeline,
+    NonRowLocalTransformer,
     PydanticValidationError
 )
 
@@ -67,3 +68,10 @@ async def pydantic_validation_error_handler(request: Request, exc: PydanticValid
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
+
+
+async def non_row_local_transformer_handler(request: Request, exc: NonRowLocalTransformer):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail}
+    )
@@ -36,3 +36,9 @@ class EmptyPipeline(HTTPException):
 class PydanticValidationError(HTTPException):
     def __init__(self, message: str):
         super().__init__(status_code=400, detail=f"{message}")
+
+
+class NonRowLocalTransformer(HTTPException):
+    def __init__(self, transformer_name: str):
+        super().__init__(status_code=400,
+                         detail=f"Transformer '{transformer_name}' is not row-local and cannot run incrementally")
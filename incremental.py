@@ -0,0 +1,60 @@
+# Checkpoints for incremental transforms of append-only CSV files
+
+import hashlib
+from collections import OrderedDict
+
+
+class Checkpoint:
+    def __init__(self, offset: int, row_count: int, prefix_hash: str, dtypes: dict):
+        self.offset = offset
+        self.row_count = row_count
+        self.prefix_hash = prefix_hash
+        # Column dtypes of the processed rows, so appended rows are parsed
+        # the same way a full recompute would parse them.
+        self.dtypes = dtypes
+
+
+class CheckpointStore:
+    # Sources and pipelines come from clients, so only the most recently
+    # used checkpoints are kept; an evicted one just means a full recompute.
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._checkpoints = OrderedDict()
+
+    def get(self, source: str, pipeline_key: str):
+        checkpoint = self._checkpoints.get((source, pipeline_key))
+        if checkpoint is not None:
+            self._checkpoints.move_to_end((source, pipeline_key))
+        return checkpoint
+
+    def save(self, source: str, pipeline_key: str, checkpoint: Checkpoint):
+        self._checkpoints[(source, pipeline_key)] = checkpoint
+        self._checkpoints.move_to_end((source, pipeline_key))
+        while len(self._checkpoints) > self.max_size:
+            self._checkpoints.popitem(last=False)
+
+
+def split_new_rows(contents: bytes, checkpoint):
+    """
+    Return (csv_bytes, end, prefix_hash). Only complete lines are processed:
+    end is the offset just past the last newline and prefix_hash covers
+    contents[:end], so an incomplete trailing row is left for the next request.
+    csv_bytes is the header followed by the rows appended since the
+    checkpoint, or None when the whole file has to be recomputed because
+    there is no usable checkpoint or its prefix has changed.
+    """
+    end = contents.rfind(b"\n") + 1
+    view = memoryview(contents)
+    if checkpoint is None or checkpoint.row_count == 0 or end < checkpoint.offset:
+        return None, end, hashlib.sha256(view[:end]).hexdigest()
+
+    hasher = hashlib.sha256(view[:checkpoint.offset])
+    if hasher.hexdigest() != checkpoint.prefix_hash:
+        return None, end, hashlib.sha256(view[:end]).hexdigest()
+
+    hasher.update(view[checkpoint.offset:end])
+    header_end = contents.find(b"\n") + 1
+    return contents[:header_end] + contents[checkpoint.offset:end], end, hasher.hexdigest()
+
+
+checkpoints = CheckpointStore()
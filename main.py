@@ -2,11 +2,13 @@
 
 import io
 import json
+from typing import Optional
 
 import pandas as pd
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile, Security, Depends
 from fastapi.responses import JSONResponse
 from fastapi.security.api_key import APIKeyHeader
+from pandas.api.types import is_object_dtype
 from pydantic_core import ValidationError
 
 # Needed to register transformers
@@ -19,6 +21,7 @@ from exception_handler import (
     invalid_pipeline_param_handler,
     unknown_transformer_handler,
     empty_pipe_line_hanlder,
+    non_row_local_transformer_handler,
     pydantic_validation_error_handler
 )
 from exceptions import (
@@ -28,8 +31,10 @@ from exceptions import (
     InvalidPipelineParam,
     UnknownTransformer,
     EmptyPipeline,
+    NonRowLocalTransformer,
     PydanticValidationError
 )
+from incremental import Checkpoint, checkpoints, split_new_rows
 from registry import registry
 from schemas import TransformationPipeline
 
@@ -43,6 +48,7 @@ app.add_exception_handler(UnknownTransformer, unknown_transformer_handler)
 app.add_exception_handler(InvalidPipelineParam, invalid_pipeline_param_handler)
 app.add_exception_handler(EmptyPipeline, empty_pipe_line_hanlder)
 app.add_exception_handler(PydanticValidationError, pydantic_validation_error_handler)
+app.add_exception_handler(NonRowLocalTransformer, non_row_local_transformer_handler)
 
 API_KEY = "supersecretkey123"
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -54,26 +60,24 @@ async def authorize_api_key(api_key: str = Security(api_key_header)):
     return api_key
 
 
-@app.post("/transform/")
-async def transform_data(
-    api_key: str = Depends(authorize_api_key),
-    file: UploadFile = File(...),
-    pipeline: str = Form(...)
-):
+def read_csv(data: bytes, dtype=None) -> pd.DataFrame:
     try:
-        contents = await file.read()
-        df = pd.read_csv(io.StringIO(contents.decode("utf-8")))
+        return pd.read_csv(io.StringIO(data.decode("utf-8")), dtype=dtype)
     except Exception:
         raise InvalidCSV()
 
+
+def load_pipeline(pipeline: str):
     try:
         steps = json.loads(pipeline)
-        steps = TransformationPipeline.model_validate(steps).root
+        return TransformationPipeline.model_validate(steps).root
     except json.JSONDecodeError:
         raise InvalidPipelineJSON()
     except ValidationError as e:
         raise PydanticValidationError(e)
 
+
+def run_pipeline(df: pd.DataFrame, steps) -> pd.DataFrame:
     # We can automatically plug the required transformer in
     # Or we also can hard-code which one to use here.
     for step in steps:
@@ -84,8 +88,72 @@ async def transform_data(
             df = transformer(df, **step.params)
         except TypeError:
             raise InvalidPipelineParam()
+    return df
+
+
+@app.post("/transform/")
+async def transform_data(
+    api_key: str = Depends(authorize_api_key),
+    file: UploadFile = File(...),
+    pipeline: str = Form(...),
+    source: Optional[str] = Form(None)
+):
+    contents = await file.read()
+    try:
+        steps = load_pipeline(pipeline)
+    except HTTPException:
+        # An invalid CSV is reported before an invalid pipeline.
+        read_csv(contents)
+        raise
+
+    if source is None:
+        df = run_pipeline(read_csv(contents), steps)
+        return JSONResponse(content=df.to_dict(orient="records"))
+
+    # With a source name only the rows appended since the last request for
+    # the same source and pipeline are transformed. This is only correct
+    # when every step is row-local.
+    for step in steps:
+        if registry.get(step.name) and not registry.is_row_local(step.name):
+            raise NonRowLocalTransformer(step.name)
+    pipeline_key = json.dumps([step.model_dump() for step in steps], sort_keys=True)
+    checkpoint = checkpoints.get(source, pipeline_key)
+    new_rows, end, prefix_hash = split_new_rows(contents, checkpoint)
+    if end == 0:
+        # Not even the header line is complete yet.
+        return JSONResponse(content=[], headers={"X-Transform-Mode": "full"})
+
+    df = None
+    if new_rows is not None:
+        # Let pandas infer the types of the appended rows on their own and
+        # stay incremental only when they agree with the earlier rows; a full
+        # parse would otherwise infer different types. String columns stay
+        # strings whatever is appended, so they are read as such.
+        object_columns = {
+            column: object for column, dtype in checkpoint.dtypes.items() if is_object_dtype(dtype)
+        }
+        try:
+            df = read_csv(new_rows, dtype=object_columns)
+        except InvalidCSV:
+            df = None
+        if df is not None and len(df) and df.dtypes.to_dict() != checkpoint.dtypes:
+            df = None
+        if df is not None:
+            row_count = checkpoint.row_count + len(df)
+            dtypes = checkpoint.dtypes
+    mode = "full" if df is None else "incremental"
+    if df is None:
+        df = read_csv(contents[:end])
+        row_count = len(df)
+        dtypes = df.dtypes.to_dict()
 
-    return JSONResponse(content=df.to_dict(orient="records"))
+    df = run_pipeline(df, steps)
+    response = JSONResponse(
+        content=df.to_dict(orient="records"),
+        headers={"X-Transform-Mode": mode}
+    )
+    checkpoints.save(source, pipeline_key, Checkpoint(end, row_count, prefix_hash, dtypes))
+    return response
 
 
 @app.get("/available-transformers/")
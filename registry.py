@@ -4,16 +4,26 @@
 class TransformerRegistry:
     def __init__(self):
         self._registry = {}
+        self._row_local = set()
 
-    def register(self, name):
+    def register(self, name, row_local=False):
+        # row_local transformers compute each output row from its input row
+        # alone, so they can be applied to an appended tail independently.
         def wrapper(func):
             self._registry[name] = func
+            if row_local:
+                self._row_local.add(name)
+            else:
+                self._row_local.discard(name)
             return func
         return wrapper
 
     def get(self, name):
         return self._registry.get(name)
 
+    def is_row_local(self, name):
+        return name in self._row_local
+
     def available_transformers(self):
         return self._registry
 
@@ -0,0 +1,26 @@
+from incremental import Checkpoint, CheckpointStore
+
+
+def make_checkpoint():
+    return Checkpoint(offset=0, row_count=0, prefix_hash="", dtypes={})
+
+
+def test_checkpoint_store_evicts_least_recently_used():
+    store = CheckpointStore(max_size=2)
+    store.save("a", "pipeline", make_checkpoint())
+    store.save("b", "pipeline", make_checkpoint())
+    assert store.get("a", "pipeline") is not None
+
+    store.save("c", "pipeline", make_checkpoint())
+    assert store.get("a", "pipeline") is not None
+    assert store.get("b", "pipeline") is None
+    assert store.get("c", "pipeline") is not None
+
+
+def test_checkpoint_store_is_keyed_on_source_and_pipeline():
+    store = CheckpointStore()
+    checkpoint = make_checkpoint()
+    store.save("a", "pipeline", checkpoint)
+    assert store.get("a", "pipeline") is checkpoint
+    assert store.get("a", "other pipeline") is None
+    assert store.get("b", "pipeline") is None
@@ -4,7 +4,10 @@ import json
 import pytest
 from fastapi.testclient import TestClient
 
+import main
+from incremental import checkpoints
 from main import app
+from registry import registry
 
 client = TestClient(app)
 
@@ -225,3 +228,177 @@ def test_multiple_transformers_error_handling():
         response = client.post("/transform/", files=files, data=data, headers=HEADERS)
         assert response.status_code == 400
         assert expected_error in response.json()["detail"]
+
+
+def post_transform(csv_content, pipeline, source=None):
+    files = {"file": ("test.csv", io.BytesIO(csv_content), "text/csv")}
+    data = {"pipeline": json.dumps(pipeline)}
+    if source is not None:
+        data["source"] = source
+    return client.post("/transform/", files=files, data=data, headers=HEADERS)
+
+
+def test_incremental_transform_returns_only_appended_rows():
+    pipeline = [{"name": "uppercase_column", "params": {"column": "name"}}]
+    csv_content = b"name,status\nJohn,active\nJane,inactive\n"
+
+    response = post_transform(csv_content, pipeline, "feed-append")
+    assert response.status_code == 200
+    assert response.headers["X-Transform-Mode"] == "full"
+    assert [r["name"] for r in response.json()] == ["JOHN", "JANE"]
+
+    csv_content += b"Alice,active\n"
+    response = post_transform(csv_content, pipeline, "feed-append")
+    assert response.status_code == 200
+    assert response.headers["X-Transform-Mode"] == "incremental"
+    assert response.json() == [{"name": "ALICE", "status": "active"}]
+
+    response = post_transform(csv_content, pipeline, "feed-append")
+    assert response.headers["X-Transform-Mode"] == "incremental"
+    assert response.json() == []
+
+
+def test_incremental_transform_recomputes_when_prefix_changes():
+    pipeline = [{"name": "filter_rows", "params": {"column": "status", "value": "active"}}]
+
+    post_transform(b"name,status\nJohn,active\n", pipeline, "feed-rewrite")
+    response = post_transform(b"name,status\nJack,active\nJane,active\n", pipeline, "feed-rewrite")
+    assert response.status_code == 200
+    assert response.headers["X-Transform-Mode"] == "full"
+    assert [r["name"] for r in response.json()] == ["Jack", "Jane"]
+
+
+def test_incremental_checkpoint_is_per_pipeline():
+    csv_content = b"name,status\nJohn,active\n"
+    post_transform(csv_content, [{"name": "uppercase_column", "params": {"column": "name"}}], "feed-pipelines")
+
+    response = post_transform(csv_content, [{"name": "trim_whitespace", "params": {"column": "name"}}], "feed-pipelines")
+    assert response.headers["X-Transform-Mode"] == "full"
+    assert response.json() == [{"name": "John", "status": "active"}]
+
+
+def test_incremental_transform_rejects_non_row_local_transformer():
+    @registry.register("sort_rows")
+    def sort_rows(df, column):
+        return df.sort_values(column)
+
+    try:
+        pipeline = [{"name": "sort_rows", "params": {"column": "name"}}]
+        response = post_transform(b"name,status\nJohn,active\n", pipeline, "feed-sorted")
+        assert response.status_code == 400
+        assert "not row-local" in response.json()["detail"]
+    finally:
+        registry._registry.pop("sort_rows")
+
+
+@pytest.mark.parametrize("source, prefix, appended, pipeline, mode", [
+    (
+        "feed-dtype-object",
+        b"name,code\nJohn,abc\nJane,1\n",
+        b"Bob,1\n",
+        [{"name": "filter_rows", "params": {"column": "code", "value": "1"}}],
+        "incremental",
+    ),
+    (
+        "feed-dtype-int",
+        b"name,age\nJohn,30\n",
+        b"Jane,25\n",
+        [{"name": "uppercase_column", "params": {"column": "name"}}],
+        "incremental",
+    ),
+    (
+        "feed-dtype-widened",
+        b"name,age\nJohn,30\n",
+        b"Jane,25.5\n",
+        [{"name": "uppercase_column", "params": {"column": "name"}}],
+        "full",
+    ),
+    (
+        "feed-dtype-int-float",
+        b"name,n\na,1\n",
+        b"c,1.0\n",
+        [{"name": "uppercase_column", "params": {"column": "name"}}],
+        "full",
+    ),
+    (
+        "feed-dtype-int-bool",
+        b"name,n\na,1\n",
+        b"c,True\n",
+        [{"name": "uppercase_column", "params": {"column": "name"}}],
+        "full",
+    ),
+    (
+        "feed-dtype-bool-int",
+        b"name,flag\na,True\n",
+        b"b,1\nc,0\n",
+        [{"name": "filter_rows", "params": {"column": "flag", "value": "1"}}],
+        "full",
+    ),
+])
+def test_incremental_transform_matches_full_recompute(source, prefix, appended, pipeline, mode):
+    first = post_transform(prefix, pipeline, source).json()
+    response = post_transform(prefix + appended, pipeline, source)
+    assert response.status_code == 200
+    assert response.headers["X-Transform-Mode"] == mode
+
+    expected = post_transform(prefix + appended, pipeline).json()
+    if mode == "incremental":
+        assert first + response.json() == expected
+    else:
+        assert response.json() == expected
+
+
+def test_incremental_transform_holds_back_partial_trailing_row():
+    pipeline = [{"name": "uppercase_column", "params": {"column": "name"}}]
+
+    response = post_transform(b"name,status\nJohn,active\nJane,act", pipeline, "feed-partial")
+    assert response.json() == [{"name": "JOHN", "status": "active"}]
+
+    response = post_transform(b"name,status\nJohn,active\nJane,active\nBob,active\n", pipeline, "feed-partial")
+    assert response.status_code == 200
+    assert response.headers["X-Transform-Mode"] == "incremental"
+    assert response.json() == [
+        {"name": "JANE", "status": "active"},
+        {"name": "BOB", "status": "active"},
+    ]
+
+
+def test_incremental_transform_without_complete_line():
+    pipeline = [{"name": "uppercase_column", "params": {"column": "name"}}]
+
+    response = post_transform(b"name,sta", pipeline, "feed-no-newline")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = post_transform(b"name,status\nJohn,active\n", pipeline, "feed-no-newline")
+    assert response.json() == [{"name": "JOHN", "status": "active"}]
+
+
+def test_incremental_checkpoint_unchanged_when_response_fails(monkeypatch):
+    pipeline = [{"name": "uppercase_column", "params": {"column": "name"}}]
+    prefix = b"name,status\nJohn,active\n"
+    post_transform(prefix, pipeline, "feed-failed")
+
+    def failing_response(*args, **kwargs):
+        raise RuntimeError("response failed")
+
+    with monkeypatch.context() as m:
+        m.setattr(main, "JSONResponse", failing_response)
+        failing_client = TestClient(app, raise_server_exceptions=False)
+        files = {"file": ("test.csv", io.BytesIO(prefix + b"Ja,inactive\nBob,active\n"), "text/csv")}
+        data = {"pipeline": json.dumps(pipeline), "source": "feed-failed"}
+        response = failing_client.post("/transform/", files=files, data=data, headers=HEADERS)
+        assert response.status_code == 500
+
+    assert checkpoints.get("feed-failed", json.dumps(pipeline, sort_keys=True)).offset == len(prefix)
+    response = post_transform(prefix + b"Ja,inactive\nBob,active\n", pipeline, "feed-failed")
+    assert response.headers["X-Transform-Mode"] == "incremental"
+    assert [r["name"] for r in response.json()] == ["JA", "BOB"]
+
+
+def test_incremental_transform_reports_invalid_csv_before_pipeline():
+    files = {"file": ("test.csv", io.BytesIO(b""), "text/csv")}
+    data = {"pipeline": "invalid json", "source": "feed-invalid"}
+    response = client.post("/transform/", files=files, data=data, headers=HEADERS)
+    assert response.status_code == 400
+    assert "Invalid CSV" in response.json()["detail"]
@@ -38,3 +38,19 @@ def test_register_multiple_transformers():
     assert len(registry._registry) == 2
     assert "transform1" in registry._registry
     assert "transform2" in registry._registry
+
+
+def test_register_row_local_transformer():
+    registry = TransformerRegistry()
+
+    @registry.register("row_local", row_local=True)
+    def row_local(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    @registry.register("whole_frame")
+    def whole_frame(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    assert registry.is_row_local("row_local")
+    assert not registry.is_row_local("whole_frame")
+    assert not registry.is_row_local("nonexistent")
@@ -11,33 +11,33 @@ def validate_column(df: pd.DataFrame, column: str):
         raise ColumnNotFound(column_name=column)
 
 
-@registry.register("filter_rows")
+@registry.register("filter_rows", row_local=True)
 def filter_rows(df: pd.DataFrame, column: str, value: str) -> pd.DataFrame:
     validate_column(df, column)
     return df[df[column] == value]
 
 
-@registry.register("rename_column")
+@registry.register("rename_column", row_local=True)
 def rename_column(df: pd.DataFrame, column: str, new_name: str) -> pd.DataFrame:
     validate_column(df, column)
     return df.rename(columns={column: new_name})
 
 
-@registry.register("uppercase_column")
+@registry.register("uppercase_column", row_local=True)
 def uppercase_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
     validate_column(df, column)
     df[column] = df[column].astype(str).str.upper()
     return df
 
 
-@registry.register("titlecase_column")
+@registry.register("titlecase_column", row_local=True)
 def titlecase_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
     validate_column(df, column)
     df[column] = df[column].astype(str).str.title()
     return df
 
 
-@registry.register("trim_whitespace")
+@registry.register("trim_whitespace", row_local=True)
 def trim_whitespace(df: pd.DataFrame, column: str) -> pd.DataFrame:
     validate_column(df, column)
     df[column] = df[column].astype(str).str.strip()